@@ -29,6 +29,8 @@ PROJECT_TO_PAGE_ID = {
     "경험개선": "16f1cc820da6809fb2d3dc7f91401c1d",
     "오픈소스": "2a17626c85574a958fb584f2fb2eda08"
 }
+# 노션 블록 추가 API가 한 번에 받을 수 있는 최대 블록 수
+NOTION_MAX_CHILDREN: int = 100
 
 
 def create_notion_task(
@@ -101,27 +103,21 @@ def create_notion_task(
     )
 
     page_id = response["id"]
+    children = []
 
     # 페이지에 Slack 스레드 링크 추가 (bookmark 블록)
     if thread_url:
-        notion.blocks.children.append(
-            block_id=page_id,
-            children=[
-                {
-                    "type": "bookmark",
-                    "bookmark": {
-                        "url": thread_url
-                    }
+        children.append(
+            {
+                "type": "bookmark",
+                "bookmark": {
+                    "url": thread_url
                 }
-            ]
+            }
         )
 
     if blocks:
-        for block in parse_md(blocks):
-            notion.blocks.children.append(
-                page_id,
-                children=[block]
-            )
+        children.extend(parse_md(blocks))
 
         # 템플릿의 나머지 영역을 블록으로 추가
         template = """# 작업 내용
@@ -129,11 +125,14 @@ def create_notion_task(
 # 검증
 
         """
-        for block in parse_md(template):
-            notion.blocks.children.append(
-                page_id,
-                children=[block]
-            )
+        children.extend(parse_md(template))
+
+    # 블록마다 요청하지 않고, 한 번의 요청에 최대 개수만큼 묶어서 추가
+    for i in range(0, len(children), NOTION_MAX_CHILDREN):
+        notion.blocks.children.append(
+            block_id=page_id,
+            children=children[i:i + NOTION_MAX_CHILDREN]
+        )
 
     return response["url"]
 
@@ -149,7 +148,6 @@ def update_notion_task_deadline(page_id: str, new_deadline: str):
 
     # 2) 기존 '타임라인'의 start 값 가져오기
     #    (없는 경우 None 처리 등 분기 필요)
-    old_start = None
     timeline_property = page_data["properties"].get("타임라인", {})
     date_value = timeline_property.get("date", {})
     old_start = date_value.get("start")  # 예: '2024-12-01'
@@ -195,18 +193,22 @@ def update_notion_task_status(page_id: str, new_status: str):
 
 
 @cached(TTLCache(maxsize=100, ttl=3600))
-def slack_users_list(client: WebClient):
+def slack_users_by_id(client: WebClient):
     """
-    슬랙 사용자 목록을 조회한다.
+    슬랙 사용자 목록을 조회하여 사용자 ID로 색인한 딕셔너리를 반환한다.
     """
-    return client.users_list()
+    return {user["id"]: user for user in client.users_list()["members"]}
 
 @cached(TTLCache(maxsize=100, ttl=3600))
-def notion_users_list(client: NotionClient):
+def notion_user_ids_by_email(client: NotionClient):
     """
-    노션 사용자 목록을 조회한다.
+    노션 사용자 목록을 조회하여 이메일 -> 노션 사용자 ID 딕셔너리를 반환한다.
     """
-    return client.users.list()
+    return {
+        user["person"]["email"]: user["id"]
+        for user in client.users.list()["results"]
+        if user["type"] == "person" and user["person"].get("email")
+    }
 
 # OpenAI 함수 정의
 functions = [
@@ -310,16 +312,8 @@ def app_mention(body, say):
         ts=thread_ts
     )
 
-    # 메시지에서 사용자 ID를 수집
-    user_ids = set(message["user"] for message in result["messages"] if "user" in message)
-    user_ids.add(body["event"]["user"])
-
-    # 사용자 정보 일괄 조회
-    user_info_list = slack_users_list(app.client)
-    user_dict = {
-        user["id"]: user for user in user_info_list["members"]
-        if user["id"] in user_ids
-    }
+    # 사용자 정보 일괄 조회 (사용자 ID로 색인되어 캐시됨)
+    user_dict = slack_users_by_id(app.client)
 
     today_str = datetime.now().strftime('%Y-%m-%d(%A)')
     messages = [{
@@ -365,21 +359,6 @@ def app_mention(body, say):
     slack_thread_url = (f"https://{slack_workspace}.slack.com"
                         f"/archives/{channel}/p{thread_ts_for_link}")
 
-    user_email = user_profile.get("profile", {}).get("email")
-
-    notion_users = notion_users_list(notion)
-
-    # 이메일이 slack_email인 Notion 사용자 찾기
-    matched_notion_user = next(
-        (
-            user for user in notion_users["results"]
-            if user["type"] == "person" and user["person"]["email"] == user_email
-        ),
-        None
-    )
-
-    notion_assignee_id = matched_notion_user["id"] if matched_notion_user else None
-
     chat_completion = openai_client.chat.completions.create(
         messages=messages,
         model="gpt-4o",
@@ -394,6 +373,12 @@ def app_mention(body, say):
         arguments = json.loads(response_message.function_call.arguments)
 
         if function_name == "create_notion_task":
+            # 담당자 조회는 과업 생성 시에만 필요하므로 이 분기에서만 수행
+            user_email = user_profile.get("profile", {}).get("email")
+
+            # 이메일이 slack_email인 Notion 사용자 찾기
+            notion_assignee_id = notion_user_ids_by_email(notion).get(user_email)
+
             task_url = create_notion_task(
                 title=arguments.get("title"),
                 task_type=arguments.get("task_type"),
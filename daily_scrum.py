@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 
 import requests
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 # 환경 변수 로드
 load_dotenv()
@@ -17,6 +18,9 @@ SLACK_CHANNEL_ID = 'C02JX95U7AP'
 # 추가로 workflow automation app이 채널에 등록돼야함.
 SLACK_CANVAS_ID = 'F05S8Q78CGZ'
 
+# Slack 목록 API에서 한 번에 받아올 항목 수 (Slack 권장 최대값)
+SLACK_PAGE_LIMIT = 200
+
 # 슬랙 리마인더로 정해진 시간에 메세지를 보내며
 # 이 파일을 실행하여 캔버스를 업데이트 합니다.
 # /remind #--데일리-- 스크럼 시간입니다! 출석부를 작성해주세요 😆 @channel every weekday at 16:30pm
@@ -32,9 +36,14 @@ emojis = ["😀", "😃", "😄", "😁", "😆", "😅", "😂", "🤣", "😊"
 
 def daily_scrum():
     slack_client = WebClient(token=os.environ.get("SLACK_BOT_TOKEN"))
+    # 요청 제한(HTTP 429)에 걸리면 Retry-After 만큼 기다렸다가 재시도
+    slack_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
+
+    # 출석부 제목과 근무 이벤트 조회가 같은 날짜를 보도록 현재 시각을 한 번만 구합니다.
+    now = datetime.now()
 
     # 1) 원티드스페이스에서 오늘자 WorkEvent(휴가/외근)를 받아옵니다.
-    work_events = get_wantedspace_workevent().get('results', [])
+    work_events = get_wantedspace_workevent(now).get('results', [])
     email_to_event = {}
     for event in work_events:
         email = event.get('email')
@@ -44,13 +53,10 @@ def daily_scrum():
             email_to_event[email] = event_name
 
     # Slack 사용자 목록 가져오기
-    user_ids = slack_client.conversations_members(
-        channel=SLACK_CHANNEL_ID)["members"]
+    user_ids = get_channel_member_ids(slack_client, SLACK_CHANNEL_ID)
     # 봇 사용자 제외
 
-    user_id_to_user_info = {
-        user_id: slack_client.users_info(user=user_id)['user'] for user_id in user_ids
-    }
+    user_id_to_user_info = get_slack_user_infos(slack_client, user_ids)
     user_ids = [
         user_id for user_id in user_ids if not user_id_to_user_info[user_id].get('is_bot', False)
     ]
@@ -72,8 +78,8 @@ def daily_scrum():
         )
 
     # 캔버스 내용 생성
-    today = datetime.now().strftime("%Y년 %m월 %d일")
-    content = f"{today} 출석부\n"
+    today = now.strftime("%Y년 %m월 %d일")
+    lines = [f"{today} 출석부"]
     for user_id in user_ids:
         user_info = user_id_to_user_info[user_id]
         user_name = user_info.get('real_name', 'Unknown User')
@@ -86,9 +92,10 @@ def daily_scrum():
         event_reason = email_to_event.get(user_email, "")  
 
         if event_reason:
-            content += f"- [ ] {user_name} {emoji} - {event_reason}\n"
+            lines.append(f"- [ ] {user_name} {emoji} - {event_reason}")
         else:
-            content += f"- [ ] {user_name} {emoji}\n"
+            lines.append(f"- [ ] {user_name} {emoji}")
+    content = "\n".join(lines) + "\n"
 
     # 캔버스 편집
     slack_client.canvases_edit(
@@ -103,10 +110,73 @@ def daily_scrum():
     )
 
 
-def get_wantedspace_workevent():
+def get_channel_member_ids(slack_client: WebClient, channel_id: str):
+    """
+    채널의 모든 멤버 ID를 조회한다.
+    기본 페이지 크기(100명)보다 큰 페이지로 조회하여 요청 수를 줄인다.
+
+    Args:
+        slack_client (WebClient): Slack
+        channel_id (str): Slack channel id
+
+    Returns:
+        채널 멤버의 슬랙 사용자 ID 목록
+    """
+    member_ids = []
+    cursor = None
+
+    while True:
+        response = slack_client.conversations_members(
+            channel=channel_id,
+            cursor=cursor,
+            limit=SLACK_PAGE_LIMIT
+        )
+        member_ids.extend(response["members"])
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+    return member_ids
+
+
+def get_slack_user_infos(slack_client: WebClient, user_ids):
+    """
+    사용자 ID 목록에 해당하는 슬랙 사용자 정보를 조회한다.
+    사용자마다 users_info를 호출하지 않도록 users_list로 한 번에 조회하고,
+    목록에 없는 사용자(외부 조직 멤버 등)만 개별로 조회한다.
+
+    Args:
+        slack_client (WebClient): Slack
+        user_ids (list): 슬랙 사용자 ID 목록
+
+    Returns:
+        사용자 ID를 사용자 정보로 매핑한 딕셔너리
+    """
+    target_ids = set(user_ids)
+    user_id_to_user_info = {}
+    cursor = None
+
+    while True:
+        response = slack_client.users_list(cursor=cursor, limit=SLACK_PAGE_LIMIT)
+        for member in response["members"]:
+            if member["id"] in target_ids:
+                user_id_to_user_info[member["id"]] = member
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+    for user_id in target_ids - user_id_to_user_info.keys():
+        user_id_to_user_info[user_id] = slack_client.users_info(user=user_id)['user']
+
+    return user_id_to_user_info
+
+
+def get_wantedspace_workevent(date: datetime):
     """
     Args:
-        None
+        date (datetime): 근무 이벤트를 조회할 날짜
 
     Returns:
         {
@@ -138,7 +208,7 @@ def get_wantedspace_workevent():
     """
     url = 'https://api.wantedspace.ai/tools/openapi/workevent/'
     query = {
-        'date': datetime.now().strftime('%Y-%m-%d'),
+        'date': date.strftime('%Y-%m-%d'),
         'key': os.environ.get('WANTEDSPACE_API_KEY')
     }
     headers = {
@@ -4,6 +4,7 @@ from datetime import datetime
 from dotenv import load_dotenv
 from notion_client import Client as NotionClient
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 # 환경 변수 로드
 load_dotenv()
@@ -11,10 +12,30 @@ load_dotenv()
 DATABASE_ID: str = 'a9de18b3877c453a8e163c2ee1ff4137'
 CHANNEL_ID: str = 'C087PDC9VG8'
 
+# '진행' 또는 '리뷰' 상태인 과업을 찾는 노션 필터 (여러 쿼리에서 공유)
+IN_PROGRESS_FILTER: dict = {
+    "or": [
+        {
+            "property": "상태",
+            "status": {
+                "equals": "진행"
+            }
+        },
+        {
+            "property": "상태",
+            "status": {
+                "equals": "리뷰"
+            }
+        }
+    ]
+}
+
 
 def main():
     notion = NotionClient(auth=os.environ.get("NOTION_API_KEY"))
     slack_client = WebClient(token=os.environ.get("SLACK_BOT_TOKEN"))
+    # 요청 제한(HTTP 429)에 걸리면 Retry-After 만큼 기다렸다가 재시도
+    slack_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
 
     email_to_slack_id = get_slack_user_map(slack_client)
 
@@ -90,22 +111,7 @@ def alert_overdue_tasks(
             "database_id": database_id,
             "filter": {
                 "and": [
-                    {
-                        "or": [
-                            {
-                                "property": "상태",
-                                "status": {
-                                    "equals": "진행"
-                                }
-                            },
-                            {
-                                "property": "상태",
-                                "status": {
-                                    "equals": "리뷰"
-                                }
-                            }
-                        ]
-                    },
+                    IN_PROGRESS_FILTER,
                     {
                         "property": "종료일",
                         "date": {
@@ -161,22 +167,7 @@ def alert_no_due_tasks(
             "database_id": database_id,
             "filter": {
                 "and": [
-                    {
-                        "or": [
-                            {
-                                "property": "상태",
-                                "status": {
-                                    "equals": "진행"
-                                }
-                            },
-                            {
-                                "property": "상태",
-                                "status": {
-                                    "equals": "리뷰"
-                                }
-                            }
-                        ]
-                    },
+                    IN_PROGRESS_FILTER,
                     {
                         "property": "타임라인",
                         "date": {
@@ -232,22 +223,7 @@ def alert_no_tasks(
     in_progress_tasks = notion.databases.query(
         **{
             "database_id": database_id,
-            "filter": {
-                "or": [
-                    {
-                        "property": "상태",
-                        "status": {
-                            "equals": "진행"
-                        }
-                    },
-                    {
-                        "property": "상태",
-                        "status": {
-                            "equals": "리뷰"
-                        }
-                    }
-                ]
-            }
+            "filter": IN_PROGRESS_FILTER
         }
     )
 
@@ -260,25 +236,24 @@ def alert_no_tasks(
                 assigned_emails.add(email)
 
     # 2. Slack 사용자 그룹 목록 중에서 handle이 "e"인 그룹을 찾습니다. (예: @e 그룹)
-    usergroup_id = None
-    usergroups_response = slack_client.usergroups_list()
+    #    include_users로 멤버 목록까지 함께 받아 그룹 멤버 조회 요청을 따로 하지 않습니다.
+    e_group = None
+    usergroups_response = slack_client.usergroups_list(include_users=True)
     for group in usergroups_response["usergroups"]:
-        # handle이 'e'인 사용자 그룹 찾아 ID 획득
+        # handle이 'e'인 사용자 그룹 찾기
         if group["handle"] == "e":
-            usergroup_id = group["id"]
+            e_group = group
             break
 
-    # 3. 찾은 사용자 그룹의 멤버들을 조회하여, 각 Slack user ID를 얻습니다.
-    if usergroup_id is None:
+    # 3. 찾은 사용자 그룹의 멤버들로부터 각 Slack user ID를 얻습니다.
+    if e_group is None:
         slack_client.chat_postMessage(
             channel=channel_id,
             text="엔지니어 그룹 @e를 찾을 수 없습니다. 확인부탁드립니다."
         )
         return
 
-    e_group_users_response = slack_client.usergroups_users_list(
-        usergroup=usergroup_id)
-    e_user_ids = e_group_users_response.get("users", [])
+    e_user_ids = e_group.get("users", [])
 
     # 4. email_to_slack_id는 "email -> slack user id" 매핑이므로,
     #    그 반대("slack user id -> email") 매핑을 쉽게 얻기 위해 역으로 변환합니다.
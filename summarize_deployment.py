@@ -24,17 +24,26 @@
 - 수작업을 줄이고 팀 내 의사소통 효율성을 향상시키는 것을 목표로 합니다.
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-from notion_client import Client as NotionClient
+from notion_client import APIErrorCode, APIResponseError, Client as NotionClient
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 
 NOTION_DATABASE_ID: str = "a9de18b3877c453a8e163c2ee1ff4137"
 SLACK_CHANNEL_ID: str = "C02VA2LLXH9"
 
+# 노션 API 동시 요청 수를 제한하여 순간적인 요청 폭주를 작게 유지합니다.
+# (초당 요청 수를 보장하지는 않으며, 요청 제한에 걸리면 retrieve_page가 재시도합니다.)
+NOTION_MAX_WORKERS: int = 3
+# 요청 제한(rate_limited)에 걸렸을 때 재시도할 최대 횟수
+NOTION_MAX_RETRIES: int = 3
+
 
 def get_slack_user_map(slack_client: WebClient) -> Dict[str, str]:
     """
@@ -59,12 +68,34 @@ def get_slack_user_map(slack_client: WebClient) -> Dict[str, str]:
 
     return email_to_slack_id
 
-def get_pr_links(notion: NotionClient, pr_relations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def retrieve_page(notion: NotionClient, page_id: str) -> Dict[str, Any]:
+    """노션 페이지를 조회하며, 요청 제한에 걸리면 Retry-After 만큼 기다렸다가 재시도합니다."""
+    for attempt in range(NOTION_MAX_RETRIES + 1):
+        try:
+            return notion.pages.retrieve(page_id=page_id)
+        except APIResponseError as error:
+            if error.code != APIErrorCode.RateLimited or attempt == NOTION_MAX_RETRIES:
+                raise
+            time.sleep(float(error.headers.get("retry-after", 1)))
+
+def get_pr_pages(notion: NotionClient, pr_page_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """PR 페이지들을 동시에 조회하여 페이지 ID -> 페이지 딕셔너리를 반환합니다."""
+    unique_ids: List[str] = list(dict.fromkeys(pr_page_ids))
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as executor:
+        pr_pages = executor.map(
+            lambda page_id: retrieve_page(notion, page_id),
+            unique_ids
+        )
+        return dict(zip(unique_ids, pr_pages))
+
+def get_pr_links(
+    pr_pages: Dict[str, Dict[str, Any]],
+    pr_relations: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
     """PR 관계 속성에서 PR 링크들과 병합 상태를 추출합니다."""
     pr_links_info: List[Dict[str, Any]] = []
     for relation in pr_relations:
-        pr_page_id: str = relation['id']
-        pr_page: Dict[str, Any] = notion.pages.retrieve(page_id=pr_page_id)
+        pr_page: Dict[str, Any] = pr_pages[relation['id']]
         properties: Dict[str, Any] = pr_page['properties']
 
         url_property: Dict[str, Any] = properties.get('_external_object_url', {})
@@ -114,7 +145,8 @@ def main_deploy_script():
     """
     notion = NotionClient(auth=os.environ["NOTION_API_KEY"])
     slack_client = WebClient(token=os.environ["SLACK_BOT_TOKEN"])
-    email_to_slack_id = get_slack_user_map(slack_client)
+    # 요청 제한(HTTP 429)에 걸리면 Retry-After 만큼 기다렸다가 재시도
+    slack_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
 
     today_str = datetime.now().date().isoformat()  # "YYYY-MM-DD"
 
@@ -142,11 +174,22 @@ def main_deploy_script():
         print("No tasks scheduled for deployment today.")
         return
 
+    # 담당자 멘션은 배포할 과업이 있을 때만 필요하므로 이때 사용자 목록을 조회
+    email_to_slack_id = get_slack_user_map(slack_client)
+
     # 여러 PR에서 뽑은 레포지토리들
     repos_to_deploy: Set[str] = set()
 
+    # 모든 과업의 PR 페이지를 과업별로 순차 조회하지 않고 한 번에 동시 조회
+    pr_page_ids: List[str] = [
+        relation['id']
+        for task in tasks
+        for relation in task["properties"].get('GitHub 풀 리퀘스트', {}).get('relation', [])
+    ]
+    pr_pages: Dict[str, Dict[str, Any]] = get_pr_pages(notion, pr_page_ids)
+
     # 메시지 헤더
-    message = "오늘 배포 예정 과업!\n"
+    message_lines: List[str] = ["오늘 배포 예정 과업!"]
 
     for task in tasks:
         props = task["properties"]
@@ -180,7 +223,7 @@ def main_deploy_script():
         # 4) GitHub PR 링크 정보(가정: "GitHub 풀 리퀘스트"라는 URL 속성이 있다고 가정)
         pr_link_property: Dict[str, Any] = props.get('GitHub 풀 리퀘스트', {})
         pr_relations: List[Dict[str, Any]] = pr_link_property.get('relation', [])
-        pr_links_info: List[Dict[str, Any]] = get_pr_links(notion, pr_relations)
+        pr_links_info: List[Dict[str, Any]] = get_pr_links(pr_pages, pr_relations)
 
         # PR 링크 포맷 및 레포지토리 이름 수집
         formatted_pr_links: List[str] = []
@@ -193,16 +236,16 @@ def main_deploy_script():
         pr_links_str: str = ', '.join(formatted_pr_links) if formatted_pr_links else "No PR Link"
 
         # 메시지 구성
-        message_line: str = f"{assignee_mention} {task_title_link} ({pr_links_str})\n"
-        message += message_line
+        message_lines.append(f"{assignee_mention} {task_title_link} ({pr_links_str})")
 
     # 레포지토리 안내 추가
     if repos_to_deploy:
-        message += "\n아래의 레포지토리를 배포해주세요 :ship:\n"
+        message_lines.append("\n아래의 레포지토리를 배포해주세요 :ship:")
         for repo in sorted(repos_to_deploy):
-            message += f"• {repo}\n"
+            message_lines.append(f"• {repo}")
 
     # 최종 메시지 전송
+    message: str = "\n".join(message_lines) + "\n"
     slack_client.chat_postMessage(channel=SLACK_CHANNEL_ID, text=message)
     print("Message sent to Slack.")
 